@@ -158,7 +158,7 @@ Just tell me what you'd like to do!"""
 
         parts = []
         if built.recent_task_ids:
-            parts.append(f"Recently mentioned tasks: {built.recent_task_ids}")
+            parts.append(f"Recently mentioned tasks: {list(built.recent_task_ids)}")
         if built.last_action:
             parts.append(f"Last action: {built.last_action}")
 
@@ -17,6 +17,7 @@ from skills import (
     context_builder, MessageContext,
     id_resolver, TaskReference,
     error_handler,
+    confirmation_generator, TaskInfo,
 )
 
 
@@ -261,8 +262,6 @@ class Orchestrator:
         Returns:
             Formatted string message
         """
-        from skills import confirmation_generator, TaskInfo
-
         if tool_name == "add_task":
             task_info = TaskInfo(id=result.task_id, title=result.title)
             return confirmation_generator.execute("created", task=task_info)
@@ -150,6 +150,11 @@ If a user's request is ambiguous, ask for clarification.
 Format task lists nicely for readability."""
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    """Format a single SSE frame, encoded once so the response can send it as-is."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
 class ChatKitServer:
     """Implements ChatKit protocol for streaming responses."""
 
@@ -258,7 +263,7 @@ class ChatKitServer:
         user_message: str,
         user_id: str,
         conversation_history: list = None
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """Process a message and stream ChatKit-formatted SSE events.
 
         Args:
@@ -267,7 +272,7 @@ class ChatKitServer:
             conversation_history: Optional conversation history
 
         Yields:
-            SSE-formatted event strings
+            SSE-formatted events as UTF-8 encoded bytes
         """
         # Build messages
         messages = [{"role": "system", "content": SYSTEM_PROMPT}]
@@ -318,7 +323,7 @@ class ChatKitServer:
                         "response_id": response_id,
                         "item_id": message_id
                     }
-                    yield f"event: response.output_text.delta\ndata: {json.dumps(event_data)}\n\n"
+                    yield _sse_event("response.output_text.delta", event_data)
 
                 # Handle tool calls
                 if delta.tool_calls:
@@ -388,7 +393,7 @@ class ChatKitServer:
                                     "response_id": response_id,
                                     "item_id": message_id
                                 }
-                                yield f"event: response.output_text.delta\ndata: {json.dumps(event_data)}\n\n"
+                                yield _sse_event("response.output_text.delta", event_data)
 
             # Emit completion events
             done_event = {
@@ -397,13 +402,13 @@ class ChatKitServer:
                 "response_id": response_id,
                 "item_id": message_id
             }
-            yield f"event: response.output_text.done\ndata: {json.dumps(done_event)}\n\n"
+            yield _sse_event("response.output_text.done", done_event)
 
             response_done = {
                 "type": "response.done",
                 "response_id": response_id
             }
-            yield f"event: response.done\ndata: {json.dumps(response_done)}\n\n"
+            yield _sse_event("response.done", response_done)
 
         except Exception as e:
             # Emit error event
@@ -414,7 +419,7 @@ class ChatKitServer:
                     "type": "server_error"
                 }
             }
-            yield f"event: error\ndata: {json.dumps(error_event)}\n\n"
+            yield _sse_event("error", error_event)
 
 
 # Singleton instance
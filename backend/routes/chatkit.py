@@ -6,14 +6,18 @@ while using our own backend logic, tools, and database.
 Flow: ChatKit UI → This Backend → Your Logic/Tools → SSE Response → ChatKit UI
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime
 from typing import Optional, List, Dict, Any, AsyncGenerator
 
+import anyio
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 
 from auth.dependencies import get_current_user
@@ -23,6 +27,10 @@ from models import Conversation, Message
 
 router = APIRouter(prefix="/api", tags=["chatkit"])
 
+# SSE delimiters used to locate the JSON payload inside a streamed frame
+_DATA_PREFIX = b"data: "
+_LF = b"\n"
+
 
 def _get_cors_headers(request: Request) -> dict:
     """Build CORS headers based on the request origin."""
@@ -65,7 +73,7 @@ async def stream_and_save(
     conversation_history: list,
     conversation_id: Optional[int],
     db_session: Session,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Stream response and save to database after completion."""
 
     # Get or create conversation
@@ -96,30 +104,56 @@ async def stream_and_save(
         content=user_message,
         created_at=datetime.utcnow(),
     )
-    db_session.add(user_msg)
-    db_session.commit()
+
+    def _persist_user_msg() -> None:
+        db_session.add(user_msg)
+        db_session.commit()
+
+    # Commit the user message on the threadpool while the upstream stream
+    # starts, so the first SSE frame isn't held back by a DB round-trip.
+    # The session is not touched again until this task has been awaited.
+    persist_user_msg = asyncio.create_task(run_in_threadpool(_persist_user_msg))
 
     # Stream and collect response
     full_response = ""
 
-    async for chunk in server.process_stream(
-        user_message=user_message,
-        user_id=user_id,
-        conversation_history=conversation_history
-    ):
-        yield chunk
-
-        # Extract content from SSE data
-        if "data: " in chunk:
+    try:
+        async for chunk in server.process_stream(
+            user_message=user_message,
+            user_id=user_id,
+            conversation_history=conversation_history
+        ):
+            yield chunk
+
+            # Extract content from SSE data
+            start = chunk.find(_DATA_PREFIX)
+            if start != -1:
+                start += len(_DATA_PREFIX)
+                end = chunk.find(_LF, start)
+                try:
+                    data = json.loads(chunk[start:end] if end != -1 else chunk[start:])
+                    if data.get("type") == "response.output_text.delta" and data.get("delta"):
+                        full_response += data["delta"]
+                    elif data.get("type") == "response.output_text.done" and data.get("text"):
+                        full_response = data["text"]
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    pass
+    finally:
+        # Shielded: on a client disconnect Starlette cancels the response
+        # through an anyio cancel scope, which would cancel this await too.
+        # The worker thread must be done with db_session before
+        # get_session closes it.
+        with anyio.CancelScope(shield=True):
             try:
-                data_str = chunk.split("data: ")[1].split("\n")[0]
-                data = json.loads(data_str)
-                if data.get("type") == "response.output_text.delta" and data.get("delta"):
-                    full_response += data["delta"]
-                elif data.get("type") == "response.output_text.done" and data.get("text"):
-                    full_response = data["text"]
-            except (json.JSONDecodeError, IndexError):
-                pass
+                await persist_user_msg
+                user_msg_saved = True
+            except SQLAlchemyError:
+                # Retried together with the assistant message below
+                db_session.rollback()
+                user_msg_saved = False
+
+    if not user_msg_saved:
+        db_session.add(user_msg)
 
     # Save assistant message after streaming completes
     if full_response:
@@ -134,7 +168,8 @@ async def stream_and_save(
 
         # Update conversation timestamp
         conversation.updated_at = datetime.utcnow()
-        db_session.add(conversation)
+
+    if full_response or not user_msg_saved:
         db_session.commit()
 
 
@@ -206,11 +241,11 @@ async def chatkit_endpoint(
                 "type": "error",
                 "error": {"message": "No message provided", "type": "invalid_request"}
             }
-            yield f"event: error\ndata: {json.dumps(error_event)}\n\n"
+            yield f"event: error\ndata: {json.dumps(error_event)}\n\n".encode()
 
         return StreamingResponse(
             error_stream(),
-            media_type="text/event-stream",
+            media_type="text/event-stream; charset=utf-8",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
@@ -232,7 +267,7 @@ async def chatkit_endpoint(
             conversation_id=conversation_id,
             db_session=db_session,
         ),
-        media_type="text/event-stream",
+        media_type="text/event-stream; charset=utf-8",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
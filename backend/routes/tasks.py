@@ -14,6 +14,17 @@ from schemas import TaskCreate, TaskUpdate, TaskResponse, MessageResponse
 router = APIRouter(prefix="/api", tags=["tasks"])
 
 
+def _commit_keeping_state(session: Session) -> None:
+    """Commit without expiring the session's loaded instances.
+
+    Every column a task route returns is either set in Python (timestamps,
+    defaults) or assigned at flush (primary key), so reloading the task
+    after commit would only cost an extra SELECT.
+    """
+    session.expire_on_commit = False
+    session.commit()
+
+
 @router.get("/tasks", response_model=List[TaskResponse])
 async def list_tasks(
     user_id: str = Depends(get_current_user),
@@ -49,8 +60,7 @@ async def create_task(
         description=task_data.description,
     )
     session.add(task)
-    session.commit()
-    session.refresh(task)
+    _commit_keeping_state(session)
     return task
 
 
@@ -117,9 +127,7 @@ async def update_task(
         task.description = task_data.description
 
     task.updated_at = datetime.utcnow()
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    _commit_keeping_state(session)
     return task
 
 
@@ -182,7 +190,5 @@ async def toggle_task_complete(
 
     task.completed = not task.completed
     task.updated_at = datetime.utcnow()
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    _commit_keeping_state(session)
     return task
@@ -1,30 +1,44 @@
 """Context Builder Skill - Build context from conversation history."""
 
-from typing import List, Optional
+import re
+from itertools import islice
+from operator import attrgetter
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from .base import BaseSkill
 
 
-@dataclass
+# Task ID mentions such as "task 5", "ID: 5" or "task #5"
+_TASK_ID_RE = re.compile(r"(?:task|id)[:\s#]*(\d+)", re.IGNORECASE)
+
+# Keywords in assistant replies, one named group per action they indicate.
+# Groups are in priority order; the lookahead reports every occurrence,
+# including overlapping ones, so the highest-priority keyword can be picked
+_ACTION_RE = re.compile(
+    r"(?=(?P<add>added|created)"
+    r"|(?P<complete>completed|finished)"
+    r"|(?P<delete>deleted|removed)"
+    r"|(?P<update>updated)"
+    r"|(?P<list>listed|showing))"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class MessageContext:
     """A message in the conversation context."""
     role: str  # "user", "assistant", "system"
     content: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BuiltContext:
     """Built context ready for AI agent."""
     messages: List[dict]  # OpenAI message format
     summary: Optional[str] = None
-    recent_task_ids: List[int] = None
+    recent_task_ids: Tuple[int, ...] = ()
     last_action: Optional[str] = None
 
-    def __post_init__(self):
-        if self.recent_task_ids is None:
-            self.recent_task_ids = []
-
 
 class ContextBuilderSkill(BaseSkill):
     """Build conversation context for AI agents.
@@ -58,6 +72,9 @@ Important guidelines:
 - Proactively offer relevant actions (e.g., after listing tasks, offer to help with pending ones)
 """
 
+    # Shared system message; built messages are only read downstream
+    _SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
     def execute(
         self,
         conversation_history: List[MessageContext],
@@ -75,23 +92,17 @@ Important guidelines:
         Returns:
             BuiltContext with formatted messages for OpenAI API
         """
+        # Only the tail window is sent or scanned for context
+        recent = self._truncate_history(conversation_history)
+
         messages = []
 
         # Add system prompt if requested
         if include_system_prompt:
-            messages.append({
-                "role": "system",
-                "content": self.SYSTEM_PROMPT
-            })
+            messages.append(self._SYSTEM_MSG)
 
         # Add conversation history (truncated if needed)
-        history_to_include = self._truncate_history(conversation_history)
-
-        for msg in history_to_include:
-            messages.append({
-                "role": msg.role,
-                "content": msg.content
-            })
+        messages.extend({"role": msg.role, "content": msg.content} for msg in recent)
 
         # Add current user message
         messages.append({
@@ -100,8 +111,8 @@ Important guidelines:
         })
 
         # Extract context from history
-        recent_task_ids = self._extract_recent_task_ids(conversation_history)
-        last_action = self._extract_last_action(conversation_history)
+        recent_task_ids = self._extract_recent_task_ids(recent)
+        last_action = self._extract_last_action(recent)
 
         return BuiltContext(
             messages=messages,
@@ -117,44 +128,32 @@ Important guidelines:
         # Keep the most recent messages
         return history[-self.MAX_HISTORY_MESSAGES:]
 
-    def _extract_recent_task_ids(self, history: List[MessageContext]) -> List[int]:
+    def _extract_recent_task_ids(self, history: List[MessageContext]) -> Tuple[int, ...]:
         """Extract task IDs mentioned in recent conversation."""
-        import re
-
-        task_ids = []
+        # Insertion-ordered dict doubles as an ordered set of IDs
+        task_ids = {}
         # Look at recent assistant messages for task IDs
-        for msg in reversed(history[-10:]):
+        for msg in islice(reversed(history), 10):
             if msg.role == "assistant":
-                # Look for patterns like "task 5", "ID: 5", "#5"
-                matches = re.findall(r'(?:task|id)[:\s#]*(\d+)', msg.content, re.IGNORECASE)
-                for match in matches:
-                    task_id = int(match)
-                    if task_id not in task_ids:
-                        task_ids.append(task_id)
+                for match in _TASK_ID_RE.finditer(msg.content):
+                    task_ids[int(match.group(1))] = None
+                    if len(task_ids) == 5:  # Return at most 5 recent IDs
+                        return tuple(task_ids)
 
-        return task_ids[:5]  # Return at most 5 recent IDs
+        return tuple(task_ids)
 
     def _extract_last_action(self, history: List[MessageContext]) -> Optional[str]:
         """Extract the last action performed from conversation history."""
-        action_keywords = {
-            "added": "add",
-            "created": "add",
-            "completed": "complete",
-            "finished": "complete",
-            "deleted": "delete",
-            "removed": "delete",
-            "updated": "update",
-            "listed": "list",
-            "showing": "list",
-        }
-
         # Check recent assistant messages
-        for msg in reversed(history[-5:]):
+        for msg in islice(reversed(history), 5):
             if msg.role == "assistant":
-                content_lower = msg.content.lower()
-                for keyword, action in action_keywords.items():
-                    if keyword in content_lower:
-                        return action
+                best = min(
+                    _ACTION_RE.finditer(msg.content.lower()),
+                    key=attrgetter("lastindex"),
+                    default=None,
+                )
+                if best:
+                    return best.lastgroup
 
         return None
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from .base import BaseSkill
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorResponse:
     """Structured error response."""
     message: str
@@ -58,6 +58,24 @@ class ErrorHandlerSkill(BaseSkill):
         },
     }
 
+    # Prebuilt responses for mapped types, shared when no context is given
+    _RESPONSES = {
+        name: ErrorResponse(
+            message=info["message"],
+            error_type=name,
+            suggestion=info["suggestion"],
+            recoverable=info["recoverable"],
+        )
+        for name, info in ERROR_MESSAGES.items()
+    }
+
+    # Fallback for error types without a specific mapping
+    _DEFAULT_INFO = {
+        "message": "Something went wrong.",
+        "suggestion": "Please try again or rephrase your request.",
+        "recoverable": True,
+    }
+
     def execute(
         self,
         error: Optional[Exception] = None,
@@ -82,12 +100,14 @@ class ErrorHandlerSkill(BaseSkill):
         if not error_type:
             error_type = "UnknownError"
 
+        # Plain mapped errors need no per-call formatting
+        if not context and not (error and error_type == "TaskNotFoundError"):
+            prebuilt = self._RESPONSES.get(error_type)
+            if prebuilt is not None:
+                return prebuilt
+
         # Get error info from mappings or use defaults
-        error_info = self.ERROR_MESSAGES.get(error_type, {
-            "message": "Something went wrong.",
-            "suggestion": "Please try again or rephrase your request.",
-            "recoverable": True,
-        })
+        error_info = self.ERROR_MESSAGES.get(error_type) or self._DEFAULT_INFO
 
         # Build message
         message = error_info["message"]
@@ -119,12 +139,9 @@ class ErrorHandlerSkill(BaseSkill):
         Returns:
             Formatted string message
         """
-        parts = [error_response.message]
-
         if error_response.suggestion:
-            parts.append(error_response.suggestion)
-
-        return " ".join(parts)
+            return f"{error_response.message} {error_response.suggestion}"
+        return error_response.message
 
 
 # Singleton instance
@@ -1,13 +1,14 @@
 """Filter Mapper Skill - Map natural language to filter parameters."""
 
 import re
+from operator import attrgetter
 from typing import Literal
 from dataclasses import dataclass
 
 from .base import BaseSkill
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilterParams:
     """Mapped filter parameters for list_tasks."""
     status: Literal["all", "pending", "completed"] = "all"
@@ -29,7 +30,7 @@ class FilterMapperSkill(BaseSkill):
     description = "Maps natural language to filter parameters"
 
     # Keywords indicating completed tasks
-    COMPLETED_KEYWORDS = [
+    COMPLETED_KEYWORDS = (
         r"\bcompleted?\b",
         r"\bfinished\b",
         r"\bdone\b",
@@ -37,10 +38,10 @@ class FilterMapperSkill(BaseSkill):
         r"\bmarked\s*(?:as\s+)?(?:done|complete)\b",
         r"\baccomplished\b",
         r"\bwhat\s+(?:have\s+)?i\s+(?:have\s+)?(?:finished|completed|done)\b",
-    ]
+    )
 
     # Keywords indicating pending/incomplete tasks
-    PENDING_KEYWORDS = [
+    PENDING_KEYWORDS = (
         r"\bpending\b",
         r"\bincomplete\b",
         r"\bunfinished\b",
@@ -48,22 +49,75 @@ class FilterMapperSkill(BaseSkill):
         r"\bremaining\b",
         r"\bleft\s+(?:to\s+do)?\b",
         r"\bto\s*-?\s*do\b",
-        r"\bnot\s+(?:done|completed?|finished)\b",
         r"\bopen\b",
         r"\bactive\b",
         r"\bwhat(?:'s|\s+is)\s+left\b",
         r"\bwhat\s+(?:do\s+)?i\s+(?:still\s+)?(?:need|have)\s+to\s+do\b",
         r"\bwhat\s+(?:else\s+)?(?:do\s+)?i\s+need\s+to\b",
-    ]
+    )
+
+    # Negated completion phrases; these mean pending and outrank the
+    # completed keywords they contain
+    NEGATED_COMPLETED_KEYWORDS = (
+        r"\bnot\s+(?:done|completed?|finished)\b",
+    )
 
     # Keywords indicating all tasks
-    ALL_KEYWORDS = [
+    ALL_KEYWORDS = (
         r"\ball\b",
         r"\beverything\b",
         r"\bfull\s+list\b",
         r"\bentire\b",
         r"\bwhole\b",
-    ]
+    )
+
+    # Every keyword category fused into one pattern with a named group per
+    # outcome, in priority order. The lookahead reports every keyword
+    # occurrence, so a single scan can still let "all" beat "completed"
+    # and "completed" beat "pending" wherever they appear
+    _MASTER_RE = re.compile(
+        "(?="
+        + "|".join(
+            f"(?P<{status}>" + "|".join(f"(?:{p})" for p in keywords) + ")"
+            for status, keywords in (
+                ("all", ALL_KEYWORDS),
+                ("not_completed", NEGATED_COMPLETED_KEYWORDS),
+                ("completed", COMPLETED_KEYWORDS),
+                ("pending", PENDING_KEYWORDS),
+            )
+        )
+        + ")",
+        re.IGNORECASE,
+    )
+
+    # Results are frozen, so every call shares one instance per outcome
+    _MATCHED = {
+        "all": FilterParams(status="all", confidence=0.95),
+        "completed": FilterParams(status="completed", confidence=0.9),
+        "pending": FilterParams(status="pending", confidence=0.9),
+    }
+    _MATCHED["not_completed"] = _MATCHED["pending"]
+    _EMPTY = FilterParams(status="all")
+    _GENERIC = FilterParams(status="all", confidence=0.7)
+
+    # Frequent whole queries answered by a dict lookup before any regex scan
+    COMMON_QUERIES = (
+        "show all tasks",
+        "show my tasks",
+        "show everything",
+        "list my tasks",
+        "full list",
+        "show completed tasks",
+        "what have i finished",
+        "what have i done",
+        "what's left to do",
+        "what do i still need to do",
+        "show pending tasks",
+    )
+
+    def __init__(self):
+        # Classified with the regex so both paths always agree
+        self._exact = {query: self._classify(query) for query in self.COMMON_QUERIES}
 
     def execute(self, user_input: str, **kwargs) -> FilterParams:
         """Map user input to filter parameters.
@@ -75,27 +129,28 @@ class FilterMapperSkill(BaseSkill):
             FilterParams with mapped status filter
         """
         if not user_input:
-            return FilterParams(status="all")
-
-        text = user_input.lower().strip()
-
-        # Check for explicit "all" keywords first
-        for pattern in self.ALL_KEYWORDS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return FilterParams(status="all", confidence=0.95)
-
-        # Check for completed keywords
-        for pattern in self.COMPLETED_KEYWORDS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return FilterParams(status="completed", confidence=0.9)
-
-        # Check for pending keywords
-        for pattern in self.PENDING_KEYWORDS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return FilterParams(status="pending", confidence=0.9)
+            return self._EMPTY
+
+        text = user_input.casefold().strip()
+        if not text:
+            return self._GENERIC
+
+        return self._exact.get(text) or self._classify(text)
+
+    def _classify(self, text: str) -> FilterParams:
+        """Classify normalized text with the keyword pattern."""
+        # Check for explicit "all" keywords first, then negated completion
+        # phrases, then completed, then pending
+        best = min(
+            self._MASTER_RE.finditer(text),
+            key=attrgetter("lastindex"),
+            default=None,
+        )
+        if best:
+            return self._MATCHED[best.lastgroup]
 
         # Default to "all" for generic queries
-        return FilterParams(status="all", confidence=0.7)
+        return self._GENERIC
 
 
 # Singleton instance
@@ -1,13 +1,22 @@
 """ID Resolver Skill - Find task ID from description or context."""
 
 import re
-from typing import Optional, List
+from typing import Optional, List, Set
 from dataclasses import dataclass
 
 from .base import BaseSkill
 
 
-@dataclass
+# Common words that don't help title matching
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "task", "todo", "item", "called", "named",
+    "titled", "about", "for", "to", "my", "that", "this", "one",
+    "please", "can", "you", "complete", "finish", "delete", "remove",
+    "mark", "done", "update", "edit", "change",
+})
+
+
+@dataclass(slots=True, frozen=True)
 class ResolvedTask:
     """Result of task ID resolution."""
     task_id: Optional[int] = None
@@ -16,7 +25,7 @@ class ResolvedTask:
     resolution_method: str = "none"  # "exact_id", "title_match", "fuzzy", "none"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskReference:
     """A task reference for matching."""
     id: int
@@ -38,11 +47,11 @@ class IDResolverSkill(BaseSkill):
     description = "Resolves task references to task IDs"
 
     # Patterns for direct ID extraction
-    ID_PATTERNS = [
+    ID_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
         r"(?:task|todo|item)?\s*#?\s*(\d+)",
         r"(?:id|number)\s*[:\-]?\s*(\d+)",
         r"#(\d+)",
-    ]
+    ))
 
     # Ordinal mappings
     ORDINALS = {
@@ -57,6 +66,17 @@ class IDResolverSkill(BaseSkill):
         "most recent": -1,
     }
 
+    # Any ordinal as a whole word, so "first" doesn't fire inside "firstly".
+    # Matched against casefolded text, so case-sensitive: IGNORECASE would
+    # also let "fırst" (dotless i) through, which is not an ORDINALS key
+    _ORDINAL_RE = re.compile(
+        r"\b(" + "|".join(map(re.escape, ORDINALS)) + r")\b"
+    )
+
+    # When a message names several ordinals, the one listed first in
+    # ORDINALS wins, wherever it appears in the message
+    _ORDINAL_RANK = {ordinal: rank for rank, ordinal in enumerate(ORDINALS)}
+
     def execute(
         self,
         user_input: str,
@@ -75,7 +95,7 @@ class IDResolverSkill(BaseSkill):
         if not user_input or not tasks:
             return ResolvedTask()
 
-        text = user_input.lower().strip()
+        text = user_input.casefold().strip()
 
         # Try direct ID extraction first
         result = self._try_direct_id(text, tasks)
@@ -97,7 +117,7 @@ class IDResolverSkill(BaseSkill):
     def _try_direct_id(self, text: str, tasks: List[TaskReference]) -> ResolvedTask:
         """Try to extract a direct task ID from text."""
         for pattern in self.ID_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 task_id = int(match.group(1))
                 # Verify the task exists
@@ -113,23 +133,24 @@ class IDResolverSkill(BaseSkill):
 
     def _try_ordinal(self, text: str, tasks: List[TaskReference]) -> ResolvedTask:
         """Try to resolve ordinal references like 'first task'."""
-        for ordinal, index in self.ORDINALS.items():
-            if ordinal in text:
-                try:
-                    if index == -1:
-                        # Last/latest/newest
-                        task = tasks[0]  # Assuming tasks are sorted newest first
-                    else:
-                        task = tasks[index]
-
-                    return ResolvedTask(
-                        task_id=task.id,
-                        confidence=0.9,
-                        matched_title=task.title,
-                        resolution_method="ordinal"
-                    )
-                except IndexError:
-                    pass
+        found = {match.group(1) for match in self._ORDINAL_RE.finditer(text)}
+        for ordinal in sorted(found, key=self._ORDINAL_RANK.__getitem__):
+            index = self.ORDINALS[ordinal]
+            try:
+                if index == -1:
+                    # Last/latest/newest
+                    task = tasks[0]  # Assuming tasks are sorted newest first
+                else:
+                    task = tasks[index]
+
+                return ResolvedTask(
+                    task_id=task.id,
+                    confidence=0.9,
+                    matched_title=task.title,
+                    resolution_method="ordinal"
+                )
+            except IndexError:
+                pass
         return ResolvedTask()
 
     def _try_title_match(self, text: str, tasks: List[TaskReference]) -> ResolvedTask:
@@ -139,16 +160,25 @@ class IDResolverSkill(BaseSkill):
 
         # Remove common words that don't help matching
         clean_text = self._remove_stop_words(text)
+        if not clean_text:
+            return ResolvedTask()
+        query_words = set(clean_text.split())
 
+        # Casefold, clean and tokenize every title once up front
+        cleaned = []
         for task in tasks:
-            clean_title = self._remove_stop_words(task.title.lower())
+            clean_title = self._remove_stop_words(task.title.casefold())
+            cleaned.append((task, clean_title, set(clean_title.split())))
 
+        for task, clean_title, title_words in cleaned:
             # Calculate similarity score
-            score = self._calculate_similarity(clean_text, clean_title)
+            score = self._calculate_similarity(clean_text, query_words, clean_title, title_words)
 
             if score > best_score and score >= 0.5:  # Minimum threshold
                 best_score = score
                 best_match = task
+                if score == 1.0:  # Exact match, nothing can beat it
+                    break
 
         if best_match:
             return ResolvedTask(
@@ -162,17 +192,16 @@ class IDResolverSkill(BaseSkill):
 
     def _remove_stop_words(self, text: str) -> str:
         """Remove common stop words from text."""
-        stop_words = {
-            "the", "a", "an", "task", "todo", "item", "called", "named",
-            "titled", "about", "for", "to", "my", "that", "this", "one",
-            "please", "can", "you", "complete", "finish", "delete", "remove",
-            "mark", "done", "update", "edit", "change"
-        }
-        words = text.split()
-        return " ".join(w for w in words if w not in stop_words)
-
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two strings."""
+        return " ".join(w for w in text.split() if w not in _STOP_WORDS)
+
+    def _calculate_similarity(
+        self,
+        text1: str,
+        words1: Set[str],
+        text2: str,
+        words2: Set[str],
+    ) -> float:
+        """Calculate similarity between two strings and their word sets."""
         if not text1 or not text2:
             return 0.0
 
@@ -185,12 +214,6 @@ class IDResolverSkill(BaseSkill):
             return 0.9
 
         # Word overlap (Jaccard similarity)
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-
-        if not words1 or not words2:
-            return 0.0
-
         intersection = len(words1 & words2)
         union = len(words1 | words2)
 
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from .base import BaseSkill
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedTask:
     """Represents a parsed task from natural language."""
     title: str
@@ -29,21 +29,34 @@ class TaskParserSkill(BaseSkill):
     description = "Extracts task title and description from natural language"
 
     # Patterns to remove from the beginning of user input
-    PREFIXES = [
+    PREFIXES = (
         r"^(?:please\s+)?(?:can you\s+)?(?:could you\s+)?",
         r"^(?:i want to\s+|i need to\s+|i'd like to\s+)?",
         r"^(?:add|create|make|new)\s+(?:a\s+)?(?:new\s+)?(?:task|todo|item)\s*",
         r"^(?:task|todo)\s*:?\s*",
         r"^(?:remind me to\s+|don't forget to\s+|remember to\s+)",
         r"^(?:called|named|titled)\s+",
-    ]
+    )
 
     # Patterns to extract description
-    DESCRIPTION_PATTERNS = [
+    DESCRIPTION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
         r"(?:with\s+)?(?:description|desc|details?|note)\s*[:\-]?\s*(.+)$",
         r"\s+-\s+(.+)$",  # "buy milk - get 2% milk"
         r"\s+\((.+)\)$",  # "buy milk (get 2% milk)"
-    ]
+    ))
+
+    # Prefixes stripped in sequence by one anchored pattern; each piece may
+    # match or be skipped, with any whitespace between them consumed
+    _PREFIX_RE = re.compile(
+        "^" + r"\s*".join(f"(?:{p.lstrip('^')})?" for p in PREFIXES) + r"\s*",
+        re.IGNORECASE,
+    )
+
+    # Characters trimmed from both ends of an extracted title: everything
+    # the regex \s class matches (all of it below U+3001) plus "-:,"
+    _TITLE_STRIP_CHARS = "".join(
+        c for c in map(chr, range(0x3001)) if c.isspace()
+    ) + "-:,"
 
     def execute(self, user_input: str, **kwargs) -> ParsedTask:
         """Parse task details from user input.
@@ -62,15 +75,14 @@ class TaskParserSkill(BaseSkill):
 
         # Try to extract description first
         for pattern in self.DESCRIPTION_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 description = match.group(1).strip()
                 text = text[:match.start()].strip()
                 break
 
         # Remove common prefixes
-        for pattern in self.PREFIXES:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE).strip()
+        text = self._PREFIX_RE.sub("", text, count=1).strip()
 
         # Clean up the title
         title = self._clean_title(text)
@@ -86,14 +98,12 @@ class TaskParserSkill(BaseSkill):
 
     def _clean_title(self, text: str) -> str:
         """Clean up the extracted title."""
-        # Remove leading/trailing punctuation
-        text = re.sub(r'^[\s\-:,]+|[\s\-:,]+$', '', text)
+        # Remove leading/trailing whitespace and punctuation
+        text = text.strip(self._TITLE_STRIP_CHARS)
 
         # Remove quotes if they wrap the entire title
-        if len(text) >= 2:
-            if (text[0] == '"' and text[-1] == '"') or \
-               (text[0] == "'" and text[-1] == "'"):
-                text = text[1:-1]
+        if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+            text = text[1:-1]
 
         # Capitalize first letter
         if text:
@@ -1,51 +1,98 @@
 """Shared test fixtures and configuration."""
 
+import logging
 import os
+from datetime import datetime, timedelta
 
 # CRITICAL: Set environment variables BEFORE importing any app modules
-# This prevents database.py from trying to connect to production database
+# This prevents database.py from trying to connect to production database.
+# The engine built from this URL is swapped for the in-memory test engine
+# below, so the file is never opened.
 os.environ["DATABASE_URL"] = "sqlite:///test.db"
 os.environ["BETTER_AUTH_SECRET"] = "test-secret-key-for-testing"
 os.environ["CORS_ORIGINS"] = "http://localhost:3000"
 
 import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, Session, create_engine
 from fastapi.testclient import TestClient
 
+import database
 from main import app
 from database import get_session
 from auth.dependencies import get_current_user
+from models import Task
 
 
 TEST_USER_ID = "test-user-id"
 
+# Named shared-cache in-memory database: nothing is written to disk.
+# Each pytest-xdist worker gets its own name so workers never share a lock.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = f"sqlite:///file:testdb_{_WORKER}?mode=memory&cache=shared&uri=true"
 
-@pytest.fixture(name="engine", scope="function")
+
+def pytest_configure(config):
+    """Silence per-request loggers so tests don't pay for formatting records."""
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    logging.getLogger("multipart.multipart").disabled = True
+    logging.getLogger("uvicorn.access").disabled = True
+
+
+@pytest.fixture(name="engine", scope="session")
 def engine_fixture():
-    """Create an in-memory SQLite engine for testing."""
-    # Use check_same_thread=False to allow SQLite usage across threads in tests
+    """Create one in-memory SQLite engine and schema for the whole test run."""
+    # The named shared-cache database is visible to every connection the
+    # engine opens, so the app's startup hook and the test session see the
+    # same schema. NullPool hands out a fresh connection per checkout and
+    # the keepalive connection below keeps the database from being freed.
+    # check_same_thread=False lets TestClient's worker thread use it.
     engine = create_engine(
-        "sqlite://",
+        TEST_DATABASE_URL,
         echo=False,
         connect_args={"check_same_thread": False},
-        poolclass=None  # Disable pooling for simplicity
+        poolclass=NullPool,
     )
+
+    # pysqlite defers BEGIN until the first write and ignores SAVEPOINT
+    # scoping; take over transaction control so rollbacks undo everything.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    keepalive = engine.connect()
     SQLModel.metadata.create_all(engine)
+
+    # Point the app's own engine (used by the startup hook and MCP tools)
+    # at the same in-memory database
+    app_engine = database.engine
+    database.engine = engine
     yield engine
-    # Clean up
-    try:
-        SQLModel.metadata.drop_all(engine)
-    except:
-        pass
+    database.engine = app_engine
+    keepalive.close()
     engine.dispose()
 
 
 @pytest.fixture(name="session")
 def session_fixture(engine):
-    """Create a database session for testing."""
+    """Create a database session whose changes are rolled back after the test.
+
+    Route commits only release a SAVEPOINT inside the outer transaction,
+    so every test starts from the empty schema without recreating it.
+    """
     connection = engine.connect()
     transaction = connection.begin()
-    session = Session(bind=connection)
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
 
     yield session
 
@@ -54,15 +101,19 @@ def session_fixture(engine):
     connection.close()
 
 
-@pytest.fixture(name="client")
-def client_fixture(session, engine):
-    """Create a TestClient with overridden dependencies."""
+@pytest.fixture(name="_client", scope="session")
+def shared_client_fixture(engine):
+    """Start the app once and share its TestClient across the test run."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(name="overrides")
+def overrides_fixture(session):
+    """Route the app's session and auth dependencies to the test doubles."""
 
     def get_session_override():
-        try:
-            yield session
-        finally:
-            pass
+        yield session
 
     def get_current_user_override():
         return TEST_USER_ID
@@ -70,8 +121,58 @@ def client_fixture(session, engine):
     app.dependency_overrides[get_session] = get_session_override
     app.dependency_overrides[get_current_user] = get_current_user_override
 
-    # Use context manager to ensure proper cleanup
-    with TestClient(app) as client:
-        yield client
+    yield
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(name="as_user")
+def as_user_fixture(overrides):
+    """Return a setter that switches the authenticated user for this test.
+
+    The default test user is restored on teardown, even if the test fails.
+    """
+
+    def _set(user_id):
+        app.dependency_overrides[get_current_user] = lambda: user_id
+
+    yield _set
+
+    app.dependency_overrides[get_current_user] = lambda: TEST_USER_ID
+
+
+@pytest.fixture(name="client_no_db", scope="session")
+def client_no_db_fixture(_client):
+    """Return the shared TestClient without a per-test database session.
+
+    For endpoints that never touch the database, such as /health and /.
+    """
+    return _client
+
+
+@pytest_asyncio.fixture(name="aclient")
+async def aclient_fixture(overrides):
+    """Create an AsyncClient that calls the app in-process over ASGI.
+
+    Requests run on the test's event loop, skipping TestClient's
+    thread portal. Lifespan events are not sent; the engine fixture
+    already created the schema.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def seed_tasks(session, titles):
+    """Insert tasks for the test user directly, bypassing the API.
+
+    Titles are given oldest first; created_at is spaced one second apart
+    so the list endpoint's newest-first ordering is deterministic.
+    """
+    base = datetime.utcnow()
+    session.add_all(
+        [
+            Task(title=title, user_id=TEST_USER_ID, created_at=base + timedelta(seconds=i))
+            for i, title in enumerate(titles)
+        ]
+    )
+    session.flush()
@@ -0,0 +1,140 @@
+"""Tests for ChatKit streaming and message persistence."""
+
+import json
+import time
+
+import anyio
+from sqlalchemy.exc import OperationalError
+from sqlmodel import select
+
+from models import Conversation, Message
+from routes.chatkit import stream_and_save
+from tests.conftest import TEST_USER_ID
+
+
+def _frame(event, data):
+    """Encode one SSE frame the way ChatKitServer sends it."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class StubServer:
+    """Stands in for ChatKitServer, replaying a fixed list of SSE frames."""
+
+    def __init__(self, frames, hang=False):
+        self.frames = frames
+        self.hang = hang
+
+    async def process_stream(self, user_message, user_id, conversation_history):
+        for frame in self.frames:
+            yield frame
+        if self.hang:
+            # Upstream stalls until the response is cancelled
+            await anyio.sleep_forever()
+
+
+async def _drain(server, session, user_message="Hi there"):
+    """Run stream_and_save to completion and return the streamed chunks."""
+    return [
+        chunk
+        async for chunk in stream_and_save(
+            server,
+            user_message=user_message,
+            user_id=TEST_USER_ID,
+            conversation_history=[],
+            conversation_id=None,
+            db_session=session,
+        )
+    ]
+
+
+def _saved_messages(session):
+    """Return (role, content) for every stored message, oldest first."""
+    messages = session.exec(select(Message).order_by(Message.id)).all()
+    return [(message.role, message.content) for message in messages]
+
+
+class TestStreamAndSave:
+    """Test stream_and_save passes frames through and saves both messages."""
+
+    async def test_frames_forwarded_and_done_text_saved(self, session):
+        """Test frames are streamed unchanged and the done text is saved."""
+        frames = [
+            b": keep-alive\n\n",
+            _frame("response.output_text.delta", {"type": "response.output_text.delta", "delta": "Hel"}),
+            b"event: response.output_text.delta\ndata: {not json\n\n",
+            _frame("response.output_text.delta", {"type": "response.output_text.delta", "delta": "lo"}),
+            _frame("response.output_text.done", {"type": "response.output_text.done", "text": "Hello!"}),
+            _frame("response.done", {"type": "response.done"}),
+        ]
+
+        chunks = await _drain(StubServer(frames), session)
+
+        assert chunks == frames
+        assert _saved_messages(session) == [("user", "Hi there"), ("assistant", "Hello!")]
+        conversation = session.exec(select(Conversation)).one()
+        assert conversation.title == "Hi there"
+
+    async def test_deltas_joined_when_no_done_event(self, session):
+        """Test deltas are concatenated, including a frame with no trailing newline."""
+        frames = [
+            _frame("response.output_text.delta", {"type": "response.output_text.delta", "delta": "Task "}),
+            b'data: {"type": "response.output_text.delta", "delta": "added"}',
+        ]
+
+        await _drain(StubServer(frames), session)
+
+        assert _saved_messages(session) == [("user", "Hi there"), ("assistant", "Task added")]
+
+    async def test_only_user_message_saved_without_response_text(self, session):
+        """Test no assistant message is stored when the stream has no text."""
+        frames = [_frame("error", {"type": "error", "message": "upstream failed"})]
+
+        await _drain(StubServer(frames), session)
+
+        assert _saved_messages(session) == [("user", "Hi there")]
+
+    async def test_failed_user_message_commit_retried_with_reply(self, session, monkeypatch):
+        """Test a failed user-message commit is retried with the assistant message."""
+        commit = session.commit
+        calls = []
+
+        def flaky_commit():
+            calls.append(None)
+            # First commit creates the conversation; fail the user message's
+            if len(calls) == 2:
+                raise OperationalError("INSERT", {}, Exception("database is locked"))
+            commit()
+
+        monkeypatch.setattr(session, "commit", flaky_commit)
+        frames = [
+            _frame("response.output_text.done", {"type": "response.output_text.done", "text": "Done"}),
+        ]
+
+        await _drain(StubServer(frames), session)
+
+        assert len(calls) == 3
+        assert _saved_messages(session) == [("user", "Hi there"), ("assistant", "Done")]
+
+    async def test_cancelled_stream_waits_for_user_message_commit(self, session, monkeypatch):
+        """Test a cancelled stream returns only after the user message commit ends."""
+        commit = session.commit
+        calls = []
+        finished = []
+
+        def slow_commit():
+            calls.append(None)
+            # First commit creates the conversation; slow down the user message's
+            if len(calls) == 2:
+                time.sleep(0.2)
+            commit()
+            finished.append(len(calls))
+
+        monkeypatch.setattr(session, "commit", slow_commit)
+        frames = [_frame("response.output_text.delta", {"type": "response.output_text.delta", "delta": "Hi"})]
+
+        # Starlette cancels a disconnected response through an anyio scope
+        with anyio.move_on_after(0.05):
+            await _drain(StubServer(frames, hang=True), session)
+
+        assert finished == [1, 2]
+        assert _saved_messages(session) == [("user", "Hi there")]
@@ -1,54 +1,60 @@
-"""Integration tests for task routes using TestClient."""
+"""Integration tests for task routes using httpx.AsyncClient."""
 
 import pytest
 from fastapi import status
 
-from tests.conftest import TEST_USER_ID
+from tests.conftest import TEST_USER_ID, seed_tasks
+
+# 404 detail checked against the raw body, no JSON decode needed
+_NOT_FOUND_DETAIL = b'"Task not found"'
 
 
 class TestTaskRoutes:
     """Integration tests for task CRUD operations."""
 
-    def test_create_task_with_valid_data(self, client):
+    async def test_create_task_with_valid_data(self, aclient):
         """Test POST /api/tasks with valid data returns 201."""
-        response = client.post(
+        response = await aclient.post(
             "/api/tasks",
             json={"title": "Buy groceries", "description": "Milk and eggs"}
         )
 
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
-        assert data["title"] == "Buy groceries"
-        assert data["description"] == "Milk and eggs"
-        assert data["user_id"] == TEST_USER_ID
-        assert data["completed"] is False
-        assert "id" in data
-
-    def test_create_task_with_empty_title_fails(self, client):
+        # Drop server-generated fields, then compare the rest in one go
+        assert isinstance(data.pop("id"), int)
+        data.pop("created_at")
+        data.pop("updated_at")
+        assert data == {
+            "title": "Buy groceries",
+            "description": "Milk and eggs",
+            "user_id": TEST_USER_ID,
+            "completed": False,
+        }
+
+    async def test_create_task_with_empty_title_fails(self, aclient):
         """Test POST /api/tasks with empty title returns 422."""
-        response = client.post(
+        response = await aclient.post(
             "/api/tasks",
             json={"title": "", "description": "Test"}
         )
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    def test_list_tasks_returns_list(self, client):
+    async def test_list_tasks_returns_list(self, aclient):
         """Test GET /api/tasks returns list."""
-        response = client.get("/api/tasks")
+        response = await aclient.get("/api/tasks")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
 
-    def test_list_tasks_after_creating_tasks(self, client):
+    async def test_list_tasks_after_creating_tasks(self, aclient, session):
         """Test GET /api/tasks returns created tasks."""
-        # Create two tasks
-        client.post("/api/tasks", json={"title": "Task 1"})
-        client.post("/api/tasks", json={"title": "Task 2"})
+        seed_tasks(session, ["Task 1", "Task 2"])
 
         # List tasks
-        response = client.get("/api/tasks")
+        response = await aclient.get("/api/tasks")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -57,41 +63,41 @@ class TestTaskRoutes:
         assert data[0]["title"] == "Task 2"
         assert data[1]["title"] == "Task 1"
 
-    def test_get_task_by_id_existing(self, client):
+    async def test_get_task_by_id_existing(self, aclient):
         """Test GET /api/tasks/{id} for existing task returns 200."""
         # Create a task
-        create_response = client.post(
+        create_response = await aclient.post(
             "/api/tasks",
             json={"title": "Test Task"}
         )
         task_id = create_response.json()["id"]
 
         # Get the task
-        response = client.get(f"/api/tasks/{task_id}")
+        response = await aclient.get(f"/api/tasks/{task_id}")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["id"] == task_id
         assert data["title"] == "Test Task"
 
-    def test_get_task_by_id_nonexistent(self, client):
+    async def test_get_task_by_id_nonexistent(self, aclient):
         """Test GET /api/tasks/{id} for nonexistent task returns 404."""
-        response = client.get("/api/tasks/99999")
+        response = await aclient.get("/api/tasks/99999")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        assert response.json()["detail"] == "Task not found"
+        assert _NOT_FOUND_DETAIL in response.content
 
-    def test_update_task_with_new_title(self, client):
+    async def test_update_task_with_new_title(self, aclient):
         """Test PUT /api/tasks/{id} with new title returns 200."""
         # Create a task
-        create_response = client.post(
+        create_response = await aclient.post(
             "/api/tasks",
             json={"title": "Original Title"}
         )
         task_id = create_response.json()["id"]
 
         # Update the task
-        response = client.put(
+        response = await aclient.put(
             f"/api/tasks/{task_id}",
             json={"title": "Updated Title"}
         )
@@ -101,17 +107,17 @@ class TestTaskRoutes:
         assert data["title"] == "Updated Title"
         assert data["id"] == task_id
 
-    def test_update_task_with_new_description(self, client):
+    async def test_update_task_with_new_description(self, aclient):
         """Test PUT /api/tasks/{id} with new description."""
         # Create a task
-        create_response = client.post(
+        create_response = await aclient.post(
             "/api/tasks",
             json={"title": "Test Task", "description": "Original"}
         )
         task_id = create_response.json()["id"]
 
         # Update description
-        response = client.put(
+        response = await aclient.put(
             f"/api/tasks/{task_id}",
             json={"description": "Updated description"}
         )
@@ -121,129 +127,114 @@ class TestTaskRoutes:
         assert data["description"] == "Updated description"
         assert data["title"] == "Test Task"  # Title unchanged
 
-    def test_update_task_with_empty_update(self, client):
+    async def test_update_task_with_empty_update(self, aclient):
         """Test PUT /api/tasks/{id} with no fields updates nothing."""
         # Create a task
-        create_response = client.post(
+        create_response = await aclient.post(
             "/api/tasks",
             json={"title": "Test Task"}
         )
         task_id = create_response.json()["id"]
 
         # Update with empty body
-        response = client.put(f"/api/tasks/{task_id}", json={})
+        response = await aclient.put(f"/api/tasks/{task_id}", json={})
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["title"] == "Test Task"
 
-    def test_delete_task_existing(self, client):
+    async def test_delete_task_existing(self, aclient):
         """Test DELETE /api/tasks/{id} returns 200."""
         # Create a task
-        create_response = client.post(
+        create_response = await aclient.post(
             "/api/tasks",
             json={"title": "Task to Delete"}
         )
         task_id = create_response.json()["id"]
 
         # Delete the task
-        response = client.delete(f"/api/tasks/{task_id}")
+        response = await aclient.delete(f"/api/tasks/{task_id}")
 
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["message"] == "Task deleted successfully"
 
         # Verify task is deleted
-        get_response = client.get(f"/api/tasks/{task_id}")
+        get_response = await aclient.get(f"/api/tasks/{task_id}")
         assert get_response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_delete_task_nonexistent(self, client):
+    async def test_delete_task_nonexistent(self, aclient):
         """Test DELETE /api/tasks/{id} for nonexistent task returns 404."""
-        response = client.delete("/api/tasks/99999")
+        response = await aclient.delete("/api/tasks/99999")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        assert response.json()["detail"] == "Task not found"
+        assert _NOT_FOUND_DETAIL in response.content
 
-    def test_toggle_task_complete(self, client):
+    async def test_toggle_task_complete(self, aclient):
         """Test PATCH /api/tasks/{id}/complete toggles completed status."""
         # Create a task (starts as not completed)
-        create_response = client.post(
+        create_response = await aclient.post(
             "/api/tasks",
             json={"title": "Task to Complete"}
         )
         task_id = create_response.json()["id"]
 
         # Toggle to completed
-        response = client.patch(f"/api/tasks/{task_id}/complete")
+        response = await aclient.patch(f"/api/tasks/{task_id}/complete")
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["completed"] is True
 
         # Toggle back to not completed
-        response = client.patch(f"/api/tasks/{task_id}/complete")
+        response = await aclient.patch(f"/api/tasks/{task_id}/complete")
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["completed"] is False
 
-    def test_toggle_task_complete_nonexistent(self, client):
+    async def test_toggle_task_complete_nonexistent(self, aclient):
         """Test PATCH /api/tasks/{id}/complete for nonexistent task."""
-        response = client.patch("/api/tasks/99999/complete")
+        response = await aclient.patch("/api/tasks/99999/complete")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        assert response.json()["detail"] == "Task not found"
+        assert _NOT_FOUND_DETAIL in response.content
 
-    def test_user_isolation(self, client, session):
+    async def test_user_isolation(self, aclient, as_user):
         """Test tasks are isolated by user_id."""
         # Create a task as test-user
-        create_response = client.post(
+        create_response = await aclient.post(
             "/api/tasks",
             json={"title": "Test User Task"}
         )
         task_id = create_response.json()["id"]
 
-        # Override get_current_user to return different user
-        from main import app
-        from auth.dependencies import get_current_user
-
-        def get_different_user():
-            return "different-user-id"
-
-        app.dependency_overrides[get_current_user] = get_different_user
+        as_user("different-user-id")
 
         # Try to get the task as different user
-        response = client.get(f"/api/tasks/{task_id}")
+        response = await aclient.get(f"/api/tasks/{task_id}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
         # List tasks should return empty for different user
-        response = client.get("/api/tasks")
+        response = await aclient.get("/api/tasks")
         assert response.status_code == status.HTTP_200_OK
         assert len(response.json()) == 0
 
-        # Reset override
-        from tests.conftest import TEST_USER_ID
-
-        def get_current_user_override():
-            return TEST_USER_ID
-
-        app.dependency_overrides[get_current_user] = get_current_user_override
-
-    def test_health_endpoint(self, client):
+    def test_health_endpoint(self, client_no_db):
         """Test GET /health returns 200."""
-        response = client.get("/health")
+        response = client_no_db.get("/health")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_root_endpoint(self, client):
+    def test_root_endpoint(self, client_no_db):
         """Test GET / returns 200."""
-        response = client.get("/")
+        response = client_no_db.get("/")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["status"] == "ok"
         assert "message" in data
 
-    def test_create_task_without_description(self, client):
+    async def test_create_task_without_description(self, aclient):
         """Test creating task without description uses default empty string."""
-        response = client.post(
+        response = await aclient.post(
             "/api/tasks",
             json={"title": "Task without description"}
         )
@@ -252,19 +243,19 @@ class TestTaskRoutes:
         data = response.json()
         assert data["description"] == ""
 
-    def test_update_task_nonexistent(self, client):
+    async def test_update_task_nonexistent(self, aclient):
         """Test updating nonexistent task returns 404."""
-        response = client.put(
+        response = await aclient.put(
             "/api/tasks/99999",
             json={"title": "Updated"}
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        assert response.json()["detail"] == "Task not found"
+        assert _NOT_FOUND_DETAIL in response.content
 
-    def test_task_timestamps(self, client):
+    async def test_task_timestamps(self, aclient):
         """Test task has created_at and updated_at timestamps."""
-        response = client.post(
+        response = await aclient.post(
             "/api/tasks",
             json={"title": "Test Timestamps"}
         )
@@ -274,14 +265,11 @@ class TestTaskRoutes:
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_multiple_tasks_ordering(self, client):
+    async def test_multiple_tasks_ordering(self, aclient, session):
         """Test tasks are ordered by created_at descending."""
-        # Create tasks in order
-        client.post("/api/tasks", json={"title": "First"})
-        client.post("/api/tasks", json={"title": "Second"})
-        client.post("/api/tasks", json={"title": "Third"})
+        seed_tasks(session, ["First", "Second", "Third"])
 
-        response = client.get("/api/tasks")
+        response = await aclient.get("/api/tasks")
         data = response.json()
 
         # Should be in reverse order (newest first)
@@ -2,7 +2,7 @@
 
 import pytest
 from pydantic import ValidationError
-from datetime import datetime
+from datetime import datetime, timezone
 
 from schemas import (
     TaskCreate,
@@ -13,6 +13,16 @@ from schemas import (
 )
 
 
+# Fixed timestamp for tests that only need a valid datetime value
+FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Strings at and just past the title (200) and description (500) limits
+_LONG_200 = "x" * 200
+_LONG_201 = "x" * 201
+_LONG_500 = "x" * 500
+_LONG_501 = "x" * 501
+
+
 class TestTaskCreate:
     """Test TaskCreate schema validation."""
 
@@ -28,37 +38,31 @@ class TestTaskCreate:
         assert task.title == "Call mom"
         assert task.description == ""
 
-    def test_task_create_empty_title_fails(self):
-        """Test TaskCreate fails with empty title."""
-        with pytest.raises(ValidationError) as exc_info:
-            TaskCreate(title="")
-
-        errors = exc_info.value.errors()
-        assert any("title" in str(error["loc"]) for error in errors)
-
-    def test_task_create_title_too_long_fails(self):
-        """Test TaskCreate fails with title > 200 characters."""
-        long_title = "x" * 201
-        with pytest.raises(ValidationError) as exc_info:
-            TaskCreate(title=long_title)
-
-        errors = exc_info.value.errors()
-        assert any("title" in str(error["loc"]) for error in errors)
-
     def test_task_create_description_max_length(self):
         """Test TaskCreate accepts description up to 500 characters."""
-        description = "x" * 500
-        task = TaskCreate(title="Test", description=description)
+        task = TaskCreate(title="Test", description=_LONG_500)
         assert len(task.description) == 500
 
-    def test_task_create_description_too_long_fails(self):
-        """Test TaskCreate fails with description > 500 characters."""
-        long_description = "x" * 501
+    def test_task_create_title_max_length(self):
+        """Test TaskCreate accepts title up to 200 characters."""
+        task = TaskCreate(title=_LONG_200)
+        assert len(task.title) == 200
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_field",
+        [
+            ({"title": ""}, "title"),
+            ({"title": _LONG_201}, "title"),
+            ({"title": "Test", "description": _LONG_501}, "description"),
+        ],
+    )
+    def test_task_create_invalid_fails(self, kwargs, expected_field):
+        """Test TaskCreate rejects empty titles and over-long fields."""
         with pytest.raises(ValidationError) as exc_info:
-            TaskCreate(title="Test", description=long_description)
+            TaskCreate(**kwargs)
 
         errors = exc_info.value.errors()
-        assert any("description" in str(error["loc"]) for error in errors)
+        assert any(expected_field in str(error["loc"]) for error in errors)
 
 
 class TestTaskUpdate:
@@ -82,22 +86,20 @@ class TestTaskUpdate:
         assert task.title is None
         assert task.description == "Updated description"
 
-    def test_task_update_empty_title_fails(self):
-        """Test TaskUpdate fails with empty title."""
-        with pytest.raises(ValidationError) as exc_info:
-            TaskUpdate(title="")
-
-        errors = exc_info.value.errors()
-        assert any("title" in str(error["loc"]) for error in errors)
-
-    def test_task_update_title_too_long_fails(self):
-        """Test TaskUpdate fails with title > 200 characters."""
-        long_title = "x" * 201
+    @pytest.mark.parametrize(
+        "kwargs, expected_field",
+        [
+            ({"title": ""}, "title"),
+            ({"title": _LONG_201}, "title"),
+        ],
+    )
+    def test_task_update_invalid_fails(self, kwargs, expected_field):
+        """Test TaskUpdate rejects empty and over-long titles."""
         with pytest.raises(ValidationError) as exc_info:
-            TaskUpdate(title=long_title)
+            TaskUpdate(**kwargs)
 
         errors = exc_info.value.errors()
-        assert any("title" in str(error["loc"]) for error in errors)
+        assert any(expected_field in str(error["loc"]) for error in errors)
 
 
 class TestTaskResponse:
@@ -112,12 +114,12 @@ class TestTaskResponse:
             "title": "Test Task",
             "description": "Test description",
             "completed": False,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": FROZEN_TS,
+            "updated_at": FROZEN_TS,
         }
 
-        # Simulate creating from SQLModel instance
-        task = TaskResponse(**task_data)
+        # Validation isn't under test here, only attribute access
+        task = TaskResponse.model_construct(**task_data)
         assert task.id == 1
         assert task.user_id == "user-123"
         assert task.title == "Test Task"
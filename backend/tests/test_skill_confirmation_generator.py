@@ -4,67 +4,52 @@ import pytest
 
 from skills.confirmation_generator import ConfirmationGeneratorSkill, TaskInfo
 
+# Built once at import; no test mutates these
+_SAMPLE = TaskInfo(id=1, title="Buy groceries", description="Milk and eggs")
+_SAMPLES = (
+    TaskInfo(id=1, title="Buy groceries", completed=False),
+    TaskInfo(id=2, title="Call dentist", completed=True),
+    TaskInfo(id=3, title="Walk dog", completed=False),
+)
+
 
 class TestConfirmationGeneratorSkill:
     """Test ConfirmationGeneratorSkill execution and message generation."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def skill(self):
         """Create a ConfirmationGeneratorSkill instance."""
         return ConfirmationGeneratorSkill()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_task(self):
         """Create a sample task for testing."""
-        return TaskInfo(id=1, title="Buy groceries", description="Milk and eggs")
+        return _SAMPLE
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_tasks(self):
         """Create sample tasks for testing."""
-        return [
-            TaskInfo(id=1, title="Buy groceries", completed=False),
-            TaskInfo(id=2, title="Call dentist", completed=True),
-            TaskInfo(id=3, title="Walk dog", completed=False),
-        ]
-
-    def test_created_with_task(self, skill, sample_task):
-        """Test 'created' action with task contains title."""
-        result = skill.execute("created", task=sample_task)
-        assert "Buy groceries" in result
-        assert "added" in result.lower()
-
-    def test_created_with_description(self, skill, sample_task):
-        """Test 'created' action includes description if present."""
-        result = skill.execute("created", task=sample_task)
-        assert "Milk and eggs" in result
-
-    def test_created_without_task(self, skill):
-        """Test 'created' action without task returns generic message."""
-        result = skill.execute("created")
-        assert "created" in result.lower()
-        assert "successfully" in result.lower()
-
-    def test_completed_with_task(self, skill, sample_task):
-        """Test 'completed' action with task contains title."""
-        result = skill.execute("completed", task=sample_task)
-        assert "Buy groceries" in result
-        assert "complete" in result.lower()
-
-    def test_completed_without_task(self, skill):
-        """Test 'completed' action without task returns generic message."""
-        result = skill.execute("completed")
-        assert "complete" in result.lower()
-
-    def test_deleted_with_task(self, skill, sample_task):
-        """Test 'deleted' action with task contains title."""
-        result = skill.execute("deleted", task=sample_task)
-        assert "Buy groceries" in result
-        assert "removed" in result.lower()
-
-    def test_deleted_without_task(self, skill):
-        """Test 'deleted' action without task returns generic message."""
-        result = skill.execute("deleted")
-        assert "deleted" in result.lower()
+        return _SAMPLES
+
+    @pytest.mark.parametrize(
+        "action, with_task, contains",
+        [
+            ("created", True, ("buy groceries", "added", "milk and eggs")),
+            ("created", False, ("created", "successfully")),
+            ("completed", True, ("buy groceries", "complete")),
+            ("completed", False, ("complete",)),
+            ("deleted", True, ("buy groceries", "removed")),
+            ("deleted", False, ("deleted",)),
+            ("already_completed", True, ("buy groceries", "already", "complete")),
+            ("already_completed", False, ("already completed",)),
+        ],
+    )
+    def test_action_message(self, skill, sample_task, action, with_task, contains):
+        """Test each action's message with and without a task."""
+        task = sample_task if with_task else None
+        result = skill.execute(action, task=task).lower()
+        for text in contains:
+            assert text in result
 
     def test_updated_with_changes(self, skill, sample_task):
         """Test 'updated' with changes lists the changes."""
@@ -83,20 +68,18 @@ class TestConfirmationGeneratorSkill:
         result = skill.execute("updated", task=sample_task, changes=[])
         assert "No changes" in result
 
-    def test_listed_empty_tasks_pending_filter(self, skill):
-        """Test 'listed' with empty tasks and filter='pending'."""
-        result = skill.execute("listed", tasks=[], filter_applied="pending")
-        assert "no pending tasks" in result.lower()
-
-    def test_listed_empty_tasks_completed_filter(self, skill):
-        """Test 'listed' with empty tasks and filter='completed'."""
-        result = skill.execute("listed", tasks=[], filter_applied="completed")
-        assert "haven't completed" in result.lower() or "completed any" in result.lower()
-
-    def test_listed_empty_tasks_all_filter(self, skill):
-        """Test 'listed' with empty tasks and filter='all'."""
-        result = skill.execute("listed", tasks=[], filter_applied="all")
-        assert "don't have any tasks" in result.lower()
+    @pytest.mark.parametrize(
+        "filter_applied, contains",
+        [
+            ("pending", "no pending tasks"),
+            ("completed", "haven't completed any"),
+            ("all", "don't have any tasks"),
+        ],
+    )
+    def test_listed_empty_tasks(self, skill, filter_applied, contains):
+        """Test 'listed' with empty tasks for each filter."""
+        result = skill.execute("listed", tasks=[], filter_applied=filter_applied)
+        assert contains in result.lower()
 
     def test_listed_with_tasks_all_filter(self, skill, sample_tasks):
         """Test 'listed' with tasks, filter='all' shows count."""
@@ -134,18 +117,6 @@ class TestConfirmationGeneratorSkill:
         result = skill._format_changes(["title", "description", "status"])
         assert "title, description, and status" in result
 
-    def test_already_completed_with_task(self, skill, sample_task):
-        """Test 'already_completed' action with task."""
-        result = skill.execute("already_completed", task=sample_task)
-        assert "Buy groceries" in result
-        assert "already" in result.lower()
-        assert "complete" in result.lower()
-
-    def test_already_completed_without_task(self, skill):
-        """Test 'already_completed' action without task."""
-        result = skill.execute("already_completed")
-        assert "already completed" in result.lower()
-
     def test_unknown_action_returns_generic(self, skill):
         """Test unknown action returns generic message."""
         result = skill.execute("unknown_action")
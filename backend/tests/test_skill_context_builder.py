@@ -8,7 +8,7 @@ from skills.context_builder import ContextBuilderSkill, MessageContext, BuiltCon
 class TestContextBuilderSkill:
     """Test ContextBuilderSkill execution and context building."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def skill(self):
         """Create a ContextBuilderSkill instance."""
         return ContextBuilderSkill()
@@ -182,6 +182,34 @@ class TestContextBuilderSkill:
 
         assert result.last_action == "list"
 
+    def test_extract_last_action_prefers_add_over_earlier_update(self, skill):
+        """Test 'add' outranks 'update' even when mentioned later."""
+        history = [
+            MessageContext(role="assistant", content="I've updated task 3 and added task 4"),
+        ]
+
+        result = skill.execute(
+            conversation_history=history,
+            user_message="Thanks",
+            include_system_prompt=False
+        )
+
+        assert result.last_action == "add"
+
+    def test_extract_last_action_prefers_complete_over_earlier_list(self, skill):
+        """Test 'complete' outranks 'list' even when mentioned later."""
+        history = [
+            MessageContext(role="assistant", content="Showing your tasks; I completed task 2"),
+        ]
+
+        result = skill.execute(
+            conversation_history=history,
+            user_message="Nice",
+            include_system_prompt=False
+        )
+
+        assert result.last_action == "complete"
+
     def test_extract_last_action_no_action(self, skill):
         """Test _extract_last_action returns None when no action found."""
         history = [
@@ -227,6 +255,6 @@ class TestContextBuilderSkill:
         assert len(result.recent_task_ids) <= 5
 
     def test_built_context_has_default_empty_recent_task_ids(self, skill):
-        """Test BuiltContext initializes recent_task_ids as empty list."""
+        """Test BuiltContext initializes recent_task_ids as empty tuple."""
         context = BuiltContext(messages=[])
-        assert context.recent_task_ids == []
+        assert context.recent_task_ids == ()
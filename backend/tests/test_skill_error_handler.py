@@ -8,7 +8,7 @@ from skills.error_handler import ErrorHandlerSkill, ErrorResponse
 class TestErrorHandlerSkill:
     """Test ErrorHandlerSkill execution and error handling."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def skill(self):
         """Create an ErrorHandlerSkill instance."""
         return ErrorHandlerSkill()
@@ -8,7 +8,7 @@ from skills.filter_mapper import FilterMapperSkill, FilterParams
 class TestFilterMapperSkill:
     """Test FilterMapperSkill execution and mapping logic."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def skill(self):
         """Create a FilterMapperSkill instance."""
         return FilterMapperSkill()
@@ -109,3 +109,30 @@ class TestFilterMapperSkill:
         result = skill.execute("show me stuff")
         assert result.status == "all"
         assert result.confidence < 0.9
+
+    def test_all_keyword_outranks_earlier_pending(self, skill):
+        """Test an 'all' phrase wins even after a pending keyword."""
+        result = skill.execute("pending tasks - full list")
+        assert result.status == "all"
+        assert result.confidence == 0.95
+
+    def test_completed_keyword_outranks_earlier_pending(self, skill):
+        """Test a completed keyword wins even after a pending keyword."""
+        result = skill.execute("anything remaining or finished")
+        assert result.status == "completed"
+
+    def test_not_done_tasks(self, skill):
+        """Test 'not done' returns status='pending', not 'completed'."""
+        result = skill.execute("show tasks that are not done")
+        assert result.status == "pending"
+
+    def test_not_finished_tasks(self, skill):
+        """Test 'not finished' returns status='pending'."""
+        result = skill.execute("what's not finished yet")
+        assert result.status == "pending"
+        assert result.confidence == 0.9
+
+    def test_all_keyword_outranks_negated_completion(self, skill):
+        """Test an 'all' phrase still wins over 'not done'."""
+        result = skill.execute("show all tasks, even ones not done")
+        assert result.status == "all"
@@ -8,7 +8,7 @@ from skills.id_resolver import IDResolverSkill, TaskReference, ResolvedTask
 class TestIDResolverSkill:
     """Test IDResolverSkill execution and resolution logic."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def skill(self):
         """Create an IDResolverSkill instance."""
         return IDResolverSkill()
@@ -128,3 +128,20 @@ class TestIDResolverSkill:
         result = skill.execute("buy groceries", sample_tasks)
         assert result.task_id == 5
         assert result.confidence > 0.5
+
+    def test_ordinal_inside_word_ignored(self, skill, sample_tasks):
+        """Test 'last' inside another word is not treated as an ordinal."""
+        result = skill.execute("blast off", sample_tasks)
+        assert result.task_id is None
+
+    def test_ordinal_precedence_follows_ordinals_order(self, skill, sample_tasks):
+        """Test 'second' outranks an earlier 'last', and 'first' a later-listed 'second'."""
+        result = skill.execute("last pending second", sample_tasks)
+        assert result.task_id == 3  # Second in sample_tasks
+        result = skill.execute("second added first", sample_tasks)
+        assert result.task_id == 5  # First in sample_tasks
+
+    def test_ordinal_lookalike_not_matched(self, skill, sample_tasks):
+        """Test 'fırst' (dotless i) is not treated as 'first'."""
+        result = skill.execute("the fırst one", sample_tasks)
+        assert result.task_id is None
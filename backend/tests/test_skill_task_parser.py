@@ -8,7 +8,7 @@ from skills.task_parser import TaskParserSkill, ParsedTask
 class TestTaskParserSkill:
     """Test TaskParserSkill execution and parsing logic."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def skill(self):
         """Create a TaskParserSkill instance."""
         return TaskParserSkill()
@@ -66,6 +66,13 @@ class TestTaskParserSkill:
         assert result.title == "Buy milk"
         assert result.description == "get 2% milk"
 
+    def test_description_keyword_takes_priority_over_dash(self, skill):
+        """Test 'buy milk - note: urgent' splits on the keyword, not the dash."""
+        result = skill.execute("buy milk - note: urgent")
+        assert result.has_title is True
+        assert result.title == "Buy milk"
+        assert result.description == "urgent"
+
     def test_quoted_title(self, skill):
         """Test quoted title '"walk the dog"' is cleaned."""
         result = skill.execute('add task "walk the dog"')
@@ -78,6 +85,12 @@ class TestTaskParserSkill:
         assert result.has_title is True
         assert result.title == "Call dentist"
 
+    def test_unicode_whitespace_trimmed_from_title(self, skill):
+        """Test punctuation mixed with non-ASCII whitespace is trimmed."""
+        result = skill.execute("add task ,\u00a0buy milk")
+        assert result.has_title is True
+        assert result.title == "Buy milk"
+
     def test_capitalize_first_letter(self, skill):
         """Test title is capitalized."""
         result = skill.execute("add task buy groceries")
@@ -1,14 +1,47 @@
 """CLI interface for the Todo application using Rich library."""
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
+from rich.text import Text
 from rich import box
 
-from src.storage import TaskStorage, TaskNotFoundError
+from src.storage import SHORT_ID_LENGTH, TaskStorage, TaskNotFoundError
 from src.models import ValidationError
 
+# Static markup parsed once at import rather than on every print
+_MENU_TEXT = Text.from_markup(
+    "[bold cyan]1.[/] Add Task\n"
+    "[bold cyan]2.[/] View All Tasks\n"
+    "[bold cyan]3.[/] Update Task\n"
+    "[bold cyan]4.[/] Delete Task\n"
+    "[bold cyan]5.[/] Mark Complete/Incomplete\n"
+    "[bold cyan]6.[/] Exit"
+)
+_WELCOME = Text.from_markup("\n[bold blue]Welcome to Todo App![/bold blue]\n")
+_GOODBYE = Text.from_markup("\n[bold blue]Goodbye![/bold blue]\n")
+
+# Status cell, indexed by task.completed
+_STATUS = (
+    Text.from_markup("[yellow]Incomplete[/yellow]"),
+    Text.from_markup("[green]Complete[/green]"),
+)
+
+# Task table columns as (header, add_column options)
+_TASK_COLUMNS = (
+    ("ID", {"style": "dim", "width": 12}),
+    ("Title", {"style": "cyan", "min_width": 20}),
+    ("Status", {"justify": "center", "width": 12}),
+    ("Description", {"max_width": 30}),
+)
+
+# Menu choice that leaves the app
+_EXIT_CHOICE = "6"
+
+# Descriptions longer than this are cut and end in "..."
+_DESC_MAX = 30
+
 
 class TodoCLI:
     """Command-line interface for the Todo application.
@@ -21,18 +54,34 @@ class TodoCLI:
         """Initialize the CLI with a console and storage."""
         self.console = Console()
         self.storage = TaskStorage()
+        # The menu never changes, so build its panel once
+        self._menu_panel = Panel(_MENU_TEXT, title="Todo App Menu", box=box.ROUNDED)
+        # Menu choice -> handler; the exit choice is handled by run()
+        self._actions = {
+            "1": self.add_task,
+            "2": self.view_tasks,
+            "3": self.update_task,
+            "4": self.delete_task,
+            "5": self.toggle_complete,
+        }
+        self._choices = [*self._actions, _EXIT_CHOICE]
 
     def display_menu(self) -> None:
         """Display the main menu."""
-        menu_text = (
-            "[bold cyan]1.[/] Add Task\n"
-            "[bold cyan]2.[/] View All Tasks\n"
-            "[bold cyan]3.[/] Update Task\n"
-            "[bold cyan]4.[/] Delete Task\n"
-            "[bold cyan]5.[/] Mark Complete/Incomplete\n"
-            "[bold cyan]6.[/] Exit"
-        )
-        self.console.print(Panel(menu_text, title="Todo App Menu", box=box.ROUNDED))
+        self.console.print(self._menu_panel)
+
+    def _ask_task_id(self) -> str | None:
+        """Prompt for a full or short task ID and resolve it.
+
+        Returns:
+            The full task ID, or None (after printing an error) if it
+            doesn't match exactly one task.
+        """
+        entered = Prompt.ask("[cyan]Enter task ID[/cyan]")
+        task_id = self.storage.resolve_id(entered)
+        if task_id is None:
+            self.console.print(f"\n[red]Error:[/red] Task with ID {entered} not found\n")
+        return task_id
 
     def add_task(self) -> None:
         """Handle the add task flow."""
@@ -46,51 +95,52 @@ class TodoCLI:
         try:
             task = self.storage.add_task(title, description)
             self.console.print(
-                f"\n[green]Task created successfully![/green] ID: [bold]{task.id[:8]}...[/bold]\n"
+                f"\n[green]Task created successfully![/green] ID: [bold]{task.id[:SHORT_ID_LENGTH]}...[/bold]\n"
             )
         except ValidationError as e:
             self.console.print(f"\n[red]Error:[/red] {e}\n")
 
     def view_tasks(self) -> None:
         """Display all tasks in a formatted table."""
-        tasks = self.storage.get_all_tasks()
-
-        if not tasks:
+        if not self.storage:
             self.console.print(
                 "\n[yellow]No tasks found. Add a task to get started![/yellow]\n"
             )
             return
 
         table = Table(title="All Tasks", box=box.ROUNDED)
-        table.add_column("ID", style="dim", width=12)
-        table.add_column("Title", style="cyan", min_width=20)
-        table.add_column("Status", justify="center", width=12)
-        table.add_column("Description", max_width=30)
-
-        for task in tasks:
-            task_id = f"{task.id[:8]}..."
-            status = "[green]Complete[/green]" if task.completed else "[yellow]Incomplete[/yellow]"
-            desc = task.description[:27] + "..." if len(task.description) > 30 else task.description
-
-            table.add_row(task_id, task.title, status, desc)
+        for header, options in _TASK_COLUMNS:
+            table.add_column(header, **options)
+
+        for task in self.storage.iter_tasks():
+            desc = task.description
+            if len(desc) > _DESC_MAX:
+                desc = desc[:_DESC_MAX - 3] + "..."
+
+            table.add_row(
+                f"{task.id[:SHORT_ID_LENGTH]}...",
+                task.title,
+                _STATUS[task.completed],
+                desc,
+            )
 
-        self.console.print()
-        self.console.print(table)
-        self.console.print()
+        # Blank line, table, blank line in a single write
+        self.console.print(Group(Text(), table, Text()))
 
     def update_task(self) -> None:
         """Handle the update task flow."""
         self.console.print("\n[bold]Update Task[/bold]\n")
 
-        task_id = Prompt.ask("[cyan]Enter task ID[/cyan]")
+        task_id = self._ask_task_id()
+        if task_id is None:
+            return
 
         task = self.storage.get_task_by_id(task_id)
-        if task is None:
-            self.console.print(f"\n[red]Error:[/red] Task with ID {task_id} not found\n")
-            return
 
-        self.console.print(f"\nCurrent title: [bold]{task.title}[/bold]")
-        self.console.print(f"Current description: {task.description or '(none)'}\n")
+        self.console.print(
+            f"\nCurrent title: [bold]{task.title}[/bold]\n"
+            f"Current description: {task.description or '(none)'}\n"
+        )
 
         new_title = Prompt.ask(
             "[cyan]New title (press Enter to keep current)[/cyan]", default=""
@@ -99,6 +149,11 @@ class TodoCLI:
             "[cyan]New description (press Enter to keep current)[/cyan]", default=""
         )
 
+        # Both left blank means nothing to change or validate
+        if not new_title and not new_description:
+            self.console.print("\n[green]Task updated successfully![/green]\n")
+            return
+
         try:
             self.storage.update_task(
                 task_id,
@@ -113,15 +168,16 @@ class TodoCLI:
         """Handle the delete task flow with confirmation."""
         self.console.print("\n[bold]Delete Task[/bold]\n")
 
-        task_id = Prompt.ask("[cyan]Enter task ID[/cyan]")
+        task_id = self._ask_task_id()
+        if task_id is None:
+            return
 
         task = self.storage.get_task_by_id(task_id)
-        if task is None:
-            self.console.print(f"\n[red]Error:[/red] Task with ID {task_id} not found\n")
-            return
 
-        self.console.print(f"\nTask to delete: [bold]{task.title}[/bold]")
-        self.console.print(f"Description: {task.description or '(none)'}\n")
+        self.console.print(
+            f"\nTask to delete: [bold]{task.title}[/bold]\n"
+            f"Description: {task.description or '(none)'}\n"
+        )
 
         if Confirm.ask("[yellow]Are you sure you want to delete this task?[/yellow]"):
             self.storage.delete_task(task_id)
@@ -133,7 +189,9 @@ class TodoCLI:
         """Handle the mark complete/incomplete flow."""
         self.console.print("\n[bold]Mark Complete/Incomplete[/bold]\n")
 
-        task_id = Prompt.ask("[cyan]Enter task ID[/cyan]")
+        task_id = self._ask_task_id()
+        if task_id is None:
+            return
 
         try:
             task = self.storage.toggle_complete(task_id)
@@ -146,23 +204,13 @@ class TodoCLI:
 
     def run(self) -> None:
         """Run the main application loop."""
-        self.console.print("\n[bold blue]Welcome to Todo App![/bold blue]\n")
+        self.console.print(_WELCOME)
 
         while True:
             self.display_menu()
-            choice = Prompt.ask("\n[bold]Enter choice[/bold]", choices=["1", "2", "3", "4", "5", "6"], show_choices=False)
-
-            match choice:
-                case "1":
-                    self.add_task()
-                case "2":
-                    self.view_tasks()
-                case "3":
-                    self.update_task()
-                case "4":
-                    self.delete_task()
-                case "5":
-                    self.toggle_complete()
-                case "6":
-                    self.console.print("\n[bold blue]Goodbye![/bold blue]\n")
-                    break
+            choice = Prompt.ask("\n[bold]Enter choice[/bold]", choices=self._choices, show_choices=False)
+
+            if choice == _EXIT_CHOICE:
+                self.console.print(_GOODBYE)
+                break
+            self._actions[choice]()
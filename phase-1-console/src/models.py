@@ -1,11 +1,12 @@
 """Data models for the Todo application."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a todo task.
 
@@ -14,14 +15,19 @@ class Task:
         title: Task title (required, 1-100 characters).
         description: Task description (optional, max 500 characters).
         completed: Whether the task is complete.
-        created_at: Timestamp when the task was created.
+        created_ns: Creation time in nanoseconds since the epoch.
     """
 
     title: str
     description: str = ""
     completed: bool = False
     id: str = field(default_factory=lambda: str(uuid4()))
-    created_at: datetime = field(default_factory=datetime.now)
+    created_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def created_at(self) -> datetime:
+        """Local creation timestamp, built from created_ns on access."""
+        return datetime.fromtimestamp(self.created_ns / 1e9)
 
 
 class ValidationError(Exception):
@@ -42,6 +48,13 @@ def validate_title(title: str) -> str:
     Raises:
         ValidationError: If title is empty or exceeds 100 characters.
     """
+    # Already trimmed: only the length needs checking, no stripped copy.
+    # validate_description uses the same shortcut
+    if title and not (title[0].isspace() or title[-1].isspace()):
+        if len(title) > 100:
+            raise ValidationError("Title must be 100 characters or less")
+        return title
+
     title = title.strip()
     if not title:
         raise ValidationError("Title cannot be empty")
@@ -62,6 +75,14 @@ def validate_description(description: str) -> str:
     Raises:
         ValidationError: If description exceeds 500 characters.
     """
+    if not description:
+        return description
+
+    if not (description[0].isspace() or description[-1].isspace()):
+        if len(description) > 500:
+            raise ValidationError("Description must be 500 characters or less")
+        return description
+
     description = description.strip()
     if len(description) > 500:
         raise ValidationError("Description must be 500 characters or less")
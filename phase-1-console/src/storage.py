@@ -1,7 +1,12 @@
 """In-memory storage layer for todo tasks."""
 
+from collections.abc import Iterator
+
 from src.models import Task, validate_title, validate_description, ValidationError
 
+# Length of the short ID prefix shown in the CLI and accepted for lookups
+SHORT_ID_LENGTH = 8
+
 
 class TaskNotFoundError(Exception):
     """Raised when a task is not found by ID."""
@@ -20,7 +25,11 @@ class TaskStorage:
 
     def __init__(self) -> None:
         """Initialize empty task storage."""
-        self._tasks: list[Task] = []
+        # Keyed by task ID; dicts keep insertion order, so listing order
+        # is still creation order
+        self._tasks: dict[str, Task] = {}
+        # Short ID prefix -> full ID, or None when several tasks share it
+        self._prefix_index: dict[str, str | None] = {}
 
     def add_task(self, title: str, description: str = "") -> Task:
         """Create and store a new task.
@@ -39,7 +48,10 @@ class TaskStorage:
         validated_description = validate_description(description)
 
         task = Task(title=validated_title, description=validated_description)
-        self._tasks.append(task)
+        self._tasks[task.id] = task
+
+        prefix = task.id[:SHORT_ID_LENGTH]
+        self._prefix_index[prefix] = None if prefix in self._prefix_index else task.id
         return task
 
     def get_all_tasks(self) -> list[Task]:
@@ -48,7 +60,20 @@ class TaskStorage:
         Returns:
             List of all tasks (may be empty).
         """
-        return list(self._tasks)
+        return list(self._tasks.values())
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """Iterate over all tasks without copying them.
+
+        Returns:
+            Iterator over tasks in creation order. Don't add or delete
+            tasks while iterating; use get_all_tasks() for a snapshot.
+        """
+        return iter(self._tasks.values())
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self._tasks)
 
     def get_task_by_id(self, task_id: str) -> Task | None:
         """Retrieve a task by its ID.
@@ -59,10 +84,27 @@ class TaskStorage:
         Returns:
             The Task if found, None otherwise.
         """
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks.get(task_id)
+
+    def resolve_id(self, task_id: str) -> str | None:
+        """Resolve a full or short task ID to a full ID.
+
+        Args:
+            task_id: A full UUID, or its short prefix as shown in the CLI
+                (a trailing "..." is ignored).
+
+        Returns:
+            The full task ID, or None if no task matches or the short
+            prefix is shared by several tasks.
+        """
+        task_id = task_id.strip()
+        if task_id in self._tasks:
+            return task_id
+
+        prefix = task_id.removesuffix("...")
+        if len(prefix) != SHORT_ID_LENGTH:
+            return None
+        return self._prefix_index.get(prefix)
 
     def update_task(
         self,
@@ -88,10 +130,11 @@ class TaskStorage:
         if task is None:
             raise TaskNotFoundError(task_id)
 
-        if title is not None:
+        # Stored values are already validated, so an unchanged value is too
+        if title is not None and title != task.title:
             task.title = validate_title(title)
 
-        if description is not None:
+        if description is not None and description != task.description:
             task.description = validate_description(description)
 
         return task
@@ -108,11 +151,16 @@ class TaskStorage:
         Raises:
             TaskNotFoundError: If task with given ID doesn't exist.
         """
-        task = self.get_task_by_id(task_id)
-        if task is None:
+        if self._tasks.pop(task_id, None) is None:
             raise TaskNotFoundError(task_id)
 
-        self._tasks.remove(task)
+        prefix = task_id[:SHORT_ID_LENGTH]
+        if self._prefix_index[prefix] is None:
+            # Shared prefix: rebuild its entry from the remaining tasks
+            matches = [tid for tid in self._tasks if tid.startswith(prefix)]
+            self._prefix_index[prefix] = matches[0] if len(matches) == 1 else None
+        else:
+            del self._prefix_index[prefix]
         return True
 
     def toggle_complete(self, task_id: str) -> Task:
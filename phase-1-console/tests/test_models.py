@@ -38,6 +38,12 @@ class TestTask:
 
         assert task1.id != task2.id
 
+    def test_created_at_derived_from_created_ns(self) -> None:
+        """Test created_at is the datetime for the stored nanosecond stamp."""
+        task = Task(title="Stamped", created_ns=1_700_000_000_000_000_000)
+
+        assert task.created_at == datetime.fromtimestamp(1_700_000_000)
+
 
 class TestValidateTitle:
     """Tests for the validate_title function."""
@@ -63,6 +63,25 @@ class TestTaskStorageGet:
 
         assert len(storage.get_all_tasks()) == 1
 
+    def test_iter_tasks_in_creation_order(self) -> None:
+        """Test iter_tasks yields every task in creation order."""
+        storage = TaskStorage()
+        first = storage.add_task("First")
+        second = storage.add_task("Second")
+
+        assert list(storage.iter_tasks()) == [first, second]
+
+    def test_len_counts_tasks(self) -> None:
+        """Test len() reflects adds and deletes."""
+        storage = TaskStorage()
+        assert len(storage) == 0
+
+        task = storage.add_task("Task")
+        assert len(storage) == 1
+
+        storage.delete_task(task.id)
+        assert len(storage) == 0
+
     def test_get_task_by_id_found(self) -> None:
         """Test getting a task by its ID."""
         storage = TaskStorage()
@@ -82,6 +101,47 @@ class TestTaskStorageGet:
         assert result is None
 
 
+class TestTaskStorageResolveId:
+    """Tests for resolve_id method."""
+
+    def test_resolve_full_id(self) -> None:
+        """Test a full ID resolves to itself."""
+        storage = TaskStorage()
+        task = storage.add_task("Full")
+
+        assert storage.resolve_id(task.id) == task.id
+
+    def test_resolve_short_id(self) -> None:
+        """Test the 8-character prefix shown in the CLI resolves."""
+        storage = TaskStorage()
+        task = storage.add_task("Short")
+
+        assert storage.resolve_id(task.id[:8]) == task.id
+        assert storage.resolve_id(f"{task.id[:8]}...") == task.id
+
+    def test_resolve_unknown_id(self) -> None:
+        """Test unknown or wrong-length IDs don't resolve."""
+        storage = TaskStorage()
+        task = storage.add_task("Task")
+
+        assert storage.resolve_id("deadbeef") is None
+        assert storage.resolve_id(task.id[:4]) is None
+
+    def test_resolve_shared_prefix(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a prefix shared by two tasks is ambiguous until one is deleted."""
+        ids = iter(["abcd1234-0000", "abcd1234-1111"])
+        monkeypatch.setattr("src.models.uuid4", lambda: next(ids))
+        storage = TaskStorage()
+        first = storage.add_task("First")
+        second = storage.add_task("Second")
+
+        assert storage.resolve_id("abcd1234") is None
+
+        storage.delete_task(first.id)
+
+        assert storage.resolve_id("abcd1234") == second.id
+
+
 class TestTaskStorageUpdate:
     """Tests for update_task method."""
 